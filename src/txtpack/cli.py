@@ -11,9 +11,9 @@ from typing import Optional
 import structlog
 import typer
 
-from txtpack.delimiter_processing import BundlerConfig, ChecksumAlgorithm
-from txtpack.file_operations import read_input_content
-from txtpack.pipeline import pack_files, unpack_content
+from txtpack.delimiter_processing import _DEFAULT_CONFIG, BundlerConfig, ChecksumAlgorithm
+from txtpack.file_operations import read_input_bytes
+from txtpack.pipeline import unpack_content, write_packed_files
 
 structlog.configure(
     processors=[
@@ -28,8 +28,6 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
-_DEFAULT_CONFIG = BundlerConfig()
-
 app = typer.Typer(
     name="txtpack",
     help="""Bundle and unbundle files using pattern matching for prompt library workflows.
@@ -102,13 +100,11 @@ def pack(
 
     try:
         config = BundlerConfig(checksum_algorithm=checksum_algorithm)
-        packed_content = pack_files(pattern, search_dir, config)
+        file_count = write_packed_files(pattern, search_dir, sys.stdout.buffer, config)
+        sys.stdout.buffer.flush()
 
-        file_count = packed_content.count("--- FILE:")
         logger.info("found_matching_files", count=file_count, pattern=pattern)
 
-        sys.stdout.write(packed_content)
-
     except ValueError:
         logger.error("no_files_found", pattern=pattern, search_dir=str(search_dir))
         raise typer.Exit(1)
@@ -142,7 +138,7 @@ def unpack(
 
     The output directory will be created if it doesn't exist.
     """
-    content = read_input_content(input_file)
+    content = read_input_bytes(input_file)
 
     if not content.strip():
         logger.error("no_input_content_to_unpack")
@@ -156,7 +152,7 @@ def unpack(
 
         logger.info("unpacking_files_to_directory", count=len(files), output_directory=str(output_directory))
 
-        for filename, _ in files:
+        for filename in files:
             logger.info("wrote_file", filename=filename, output_path=str(output_directory / filename))
 
     except ValueError:
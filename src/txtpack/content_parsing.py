@@ -1,17 +1,49 @@
 """Content parsing utilities for extracting files from concatenated content.
 
 This module provides pure functions for parsing concatenated content that contains
-multiple files separated by delimiters. Functions operate on strings and return
-parsed file data without side effects.
+multiple files separated by delimiters. Functions operate on bytes (or strings,
+which are encoded once) and return parsed file data without side effects.
 """
 
-from typing import List, Optional, Tuple
+from array import array
+from typing import Iterator, List, Tuple, Union
 
-from txtpack.delimiter_processing import BundlerConfig, extract_next_file
+from txtpack.delimiter_processing import _DEFAULT_CONFIG, BundlerConfig, extract_next_file, locate_next_file
+
+
+def iter_parse_concatenated_content(
+    content: Union[str, bytes], config: BundlerConfig = _DEFAULT_CONFIG, verify_checksums: bool = False
+) -> Iterator[Tuple[str, str]]:
+    """Lazily yield filename-content pairs from concatenated content.
+
+    Each file is decoded only when the iterator reaches it, so callers that
+    consume pairs one at a time never hold every file's content at once.
+
+    Args:
+        content: Concatenated content containing multiple files with delimiters, as bytes or str
+        config: Optional configuration for delimiter format
+        verify_checksums: Whether to require checksum validation for all files
+
+    Yields:
+        (filename, content) tuples for successfully parsed files
+    """
+    content_bytes = content.encode("utf-8") if isinstance(content, str) else content
+    pos = 0
+
+    while pos < len(content_bytes):
+        file_data, new_pos = extract_next_file(content_bytes, pos, config, verify_checksums=verify_checksums)
+
+        if file_data is not None:
+            yield file_data
+
+        if new_pos <= pos:
+            break
+
+        pos = new_pos
 
 
 def parse_concatenated_content(
-    content: str, config: Optional[BundlerConfig] = None, verify_checksums: bool = False
+    content: Union[str, bytes], config: BundlerConfig = _DEFAULT_CONFIG, verify_checksums: bool = False
 ) -> List[Tuple[str, str]]:
     """Parse concatenated content and extract filename-content pairs using byte-accurate parsing.
 
@@ -19,7 +51,7 @@ def parse_concatenated_content(
     _parse_concatenated_content from the original CLI module.
 
     Args:
-        content: Concatenated content containing multiple files with delimiters
+        content: Concatenated content containing multiple files with delimiters, as bytes or str
         config: Optional configuration for delimiter format
         verify_checksums: Whether to require checksum validation for all files
 
@@ -36,22 +68,53 @@ def parse_concatenated_content(
         >>> parse_concatenated_content(content)
         [('test.txt', 'Hello'), ('data.json', '{"key": "value"}')]
     """
-    if config is None:
-        config = BundlerConfig()
+    return list(iter_parse_concatenated_content(content, config, verify_checksums=verify_checksums))
+
+
+def index_concatenated_content(
+    content: Union[str, bytes], config: BundlerConfig = _DEFAULT_CONFIG, verify_checksums: bool = False
+) -> Tuple[List[str], array, array]:
+    """Locate every file in concatenated content without decoding any of it.
+
+    Results are returned as parallel sequences rather than one tuple per
+    file, so listing filenames or sizing files touches only compact arrays.
+    Content can be sliced lazily with ``memoryview(content_bytes)[start:start + length]``.
+    Unlike parse_concatenated_content, file content is not checked to be valid UTF-8.
+
+    Args:
+        content: Concatenated content containing multiple files with delimiters, as bytes or str
+        config: Optional configuration for delimiter format
+        verify_checksums: Whether to require checksum validation for all files
+
+    Returns:
+        Tuple of (filenames, starts, lengths) where starts and lengths are ``array('q')``
+        byte offsets into the UTF-8 encoded content
 
-    files = []
-    content_bytes = content.encode("utf-8")
+    Example:
+        >>> filenames, starts, lengths = index_concatenated_content(
+        ...     b"--- FILE: test.txt (5 bytes) ---\\nHello\\n--- END: test.txt ---\\n"
+        ... )
+        >>> filenames, starts.tolist(), lengths.tolist()
+        (['test.txt'], [33], [5])
+    """
+    content_bytes = content.encode("utf-8") if isinstance(content, str) else content
+    filenames: List[str] = []
+    starts = array("q")
+    lengths = array("q")
     pos = 0
 
     while pos < len(content_bytes):
-        file_data, new_pos = extract_next_file(content_bytes, pos, config, verify_checksums=verify_checksums)
+        located, new_pos = locate_next_file(content_bytes, pos, config, verify_checksums=verify_checksums)
 
-        if file_data is not None:
-            files.append(file_data)
+        if located is not None:
+            filename, start, length = located
+            filenames.append(filename)
+            starts.append(start)
+            lengths.append(length)
 
         if new_pos <= pos:
             break
 
         pos = new_pos
 
-    return files
+    return filenames, starts, lengths
@@ -44,6 +44,25 @@ def read_file_content(file_path: Path) -> str:
         raise IOError(f"Failed to read file {file_path}: {e}")
 
 
+def read_file_bytes(file_path: Path) -> bytes:
+    """Read raw bytes from a file.
+
+    Args:
+        file_path: Path to the file to read
+
+    Returns:
+        File content as bytes, without newline translation or decoding
+
+    Raises:
+        IOError: If file cannot be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except IOError as e:
+        raise IOError(f"Failed to read file {file_path}: {e}")
+
+
 def write_file_content(file_path: Path, content: str) -> None:
     """Write content to a file.
 
@@ -83,6 +102,28 @@ def read_input_content(input_file: Optional[str] = None, stdin_reader: Optional[
             return sys.stdin.read()
 
 
+def read_input_bytes(input_file: Optional[str] = None, stdin_reader: Optional[Callable[[], bytes]] = None) -> bytes:
+    """Read raw bytes from input file or stdin.
+
+    Args:
+        input_file: Path to input file, if None reads from stdin
+        stdin_reader: Function to read from stdin (for testing)
+
+    Returns:
+        Content as bytes
+
+    Raises:
+        IOError: If content cannot be read
+    """
+    if input_file:
+        return read_file_bytes(Path(input_file))
+    else:
+        if stdin_reader:
+            return stdin_reader()
+        else:
+            return sys.stdin.buffer.read()
+
+
 def get_file_byte_count(content: str) -> int:
     """Get byte count of string content when encoded as UTF-8.
 
@@ -5,36 +5,142 @@ into complete pack and unpack workflows. These functions replicate the core
 logic from the CLI pack() and unpack() commands.
 """
 
+import codecs
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
-from txtpack.content_parsing import parse_concatenated_content
+from txtpack.content_parsing import iter_parse_concatenated_content
 from txtpack.delimiter_processing import (
+    _DEFAULT_CONFIG,
     BundlerConfig,
     ChecksumAlgorithm,
+    append_packed_file,
     calculate_file_checksum,
-    create_file_end_delimiter,
-    create_file_start_delimiter,
+    find_next_start_delimiter,
+    is_file_start_delimiter,
 )
 from txtpack.file_operations import (
     FileReader,
     FileWriter,
     ensure_directory_exists,
-    get_file_byte_count,
-    read_multiple_files,
+    read_file_bytes,
+    write_file_content,
 )
 from txtpack.pattern_matching import find_matching_files
 
+# Creating and writing small files is mostly kernel CPU time, so writes scale with cores
+_MAX_WRITE_WORKERS = 32
+_MAX_PENDING_WRITES = 256
+
+
+def _ensure_utf8(content_bytes: bytes, file_path: Path) -> None:
+    """Reject content that unpack could not decode back into the original file.
+
+    Raises:
+        IOError: If the content is not valid UTF-8
+    """
+    if content_bytes.isascii():
+        return
+
+    try:
+        codecs.utf_8_decode(content_bytes, "strict", True)
+    except UnicodeDecodeError as e:
+        raise IOError(f"File {file_path} is not valid UTF-8: {e}")
+
+
+def _iter_file_contents(
+    pattern: str,
+    search_directory: Path,
+    config: BundlerConfig,
+    file_reader: Optional[FileReader],
+) -> Iterator[Tuple[str, bytes, Optional[str]]]:
+    """Yield (filename, content_bytes, checksum) for each file matching a pattern."""
+    matching_files = find_matching_files(search_directory, pattern)
+
+    if not matching_files:
+        raise ValueError(f"No files found matching pattern '{pattern}' in {search_directory}")
+
+    for file_path in matching_files:
+        if file_reader is None:
+            content_bytes = read_file_bytes(file_path)
+            _ensure_utf8(content_bytes, file_path)
+        else:
+            content_bytes = file_reader(file_path).encode("utf-8")
+
+        # Calculate checksum if algorithm is specified
+        checksum = None
+        if config.checksum_algorithm != ChecksumAlgorithm.NONE:
+            checksum = calculate_file_checksum(content_bytes, config.checksum_algorithm)
+
+        yield file_path.name, content_bytes, checksum
+
+
+def iter_pack_chunks(
+    pattern: str,
+    search_directory: Path,
+    config: BundlerConfig = _DEFAULT_CONFIG,
+    file_reader: Optional[FileReader] = None,
+) -> Iterator[bytearray]:
+    """Yield the delimited block for each file matching a pattern.
+
+    Files are read one at a time as the iterator advances, so only the file
+    currently being packed is held in memory. Blocks for earlier files have
+    already been yielded when a later file fails to read, so callers that
+    must not emit a partial bundle should use pack_files or
+    write_packed_files instead. By default files are read as
+    raw bytes and packed verbatim, and must be valid UTF-8 so unpack can
+    restore them; a custom file_reader's text is encoded as UTF-8.
+
+    Args:
+        pattern: Pattern to match files (glob or regex)
+        search_directory: Directory to search for files
+        config: Optional configuration for delimiters
+        file_reader: Optional custom file reader function
+
+    Yields:
+        UTF-8 encoded block of start delimiter, content and end delimiter per file
+
+    Raises:
+        FileNotFoundError: If search directory doesn't exist
+        ValueError: If pattern is invalid or no files found
+        IOError: If files cannot be read or are not valid UTF-8
+    """
+    for filename, content_bytes, checksum in _iter_file_contents(pattern, search_directory, config, file_reader):
+        buf = bytearray()
+        append_packed_file(buf, filename, content_bytes, config, checksum)
+        yield buf
+
+
+def _pack_to_buffer(
+    pattern: str,
+    search_directory: Path,
+    config: BundlerConfig,
+    file_reader: Optional[FileReader],
+) -> Tuple[bytearray, int]:
+    """Append every file matching a pattern to one buffer; return it with the file count."""
+    buf = bytearray()
+    file_count = 0
+    for filename, content_bytes, checksum in _iter_file_contents(pattern, search_directory, config, file_reader):
+        append_packed_file(buf, filename, content_bytes, config, checksum)
+        # Release the content now so the last file isn't held alongside the finished buffer
+        del content_bytes
+        file_count += 1
+
+    return buf, file_count
+
 
 def pack_files(
     pattern: str,
     search_directory: Path,
-    config: Optional[BundlerConfig] = None,
+    config: BundlerConfig = _DEFAULT_CONFIG,
     file_reader: Optional[FileReader] = None,
 ) -> str:
     """Pack files matching a pattern into delimited content.
 
-    This function orchestrates the complete pack workflow from the CLI pack command.
+    Every file is appended to a single buffer that is decoded once, so the
+    output is never copied through per-file blocks or a final join.
 
     Args:
         pattern: Pattern to match files (glob or regex)
@@ -48,88 +154,197 @@ def pack_files(
     Raises:
         FileNotFoundError: If search directory doesn't exist
         ValueError: If pattern is invalid or no files found
-        IOError: If files cannot be read
+        IOError: If files cannot be read or are not valid UTF-8
     """
-    if config is None:
-        config = BundlerConfig()
+    buf, _ = _pack_to_buffer(pattern, search_directory, config, file_reader)
+    return buf.decode("utf-8")
 
-    matching_files = find_matching_files(search_directory, pattern)
 
-    if not matching_files:
-        raise ValueError(f"No files found matching pattern '{pattern}' in {search_directory}")
+def write_packed_files(
+    pattern: str,
+    search_directory: Path,
+    output: BinaryIO,
+    config: BundlerConfig = _DEFAULT_CONFIG,
+    file_reader: Optional[FileReader] = None,
+) -> int:
+    """Write packed files matching a pattern to a binary output.
 
-    file_data = read_multiple_files(matching_files, file_reader)
+    This function orchestrates the complete pack workflow from the CLI pack command.
+    Every file is read and validated before anything is written, so a file
+    that cannot be packed leaves the output empty rather than holding a
+    truncated bundle that would unpack without error.
 
-    content_parts = []
-    for filename, file_content in file_data:
-        byte_count = get_file_byte_count(file_content)
+    Args:
+        pattern: Pattern to match files (glob or regex)
+        search_directory: Directory to search for files
+        output: Binary stream to write delimited content to
+        config: Optional configuration for delimiters
+        file_reader: Optional custom file reader function
 
-        # Calculate checksum if algorithm is specified
-        checksum = None
-        if config.checksum_algorithm != ChecksumAlgorithm.NONE:
-            checksum = calculate_file_checksum(file_content, config.checksum_algorithm)
+    Returns:
+        Number of files written
+
+    Raises:
+        FileNotFoundError: If search directory doesn't exist
+        ValueError: If pattern is invalid or no files found
+        IOError: If files cannot be read or are not valid UTF-8
+    """
+    buf, file_count = _pack_to_buffer(pattern, search_directory, config, file_reader)
+    output.write(buf)
+    return file_count
+
+
+def _write_files_concurrently(
+    parsed_files: Iterator[Tuple[str, str]], output_directory: Path, max_workers: int
+) -> List[str]:
+    """Write parsed files with a thread pool, keeping bundle-order semantics.
 
-        start_delimiter = create_file_start_delimiter(filename, byte_count, config, checksum)
-        end_delimiter = create_file_end_delimiter(filename, config)
+    At most _MAX_PENDING_WRITES files are held in memory awaiting a write, and
+    a file repeated in the bundle waits for its earlier write so the last copy
+    wins, as it would when writing serially. Repeats are matched on the
+    normalized, case-folded output path, so names such as "a.txt", "./a.txt"
+    and "A.txt" (the same file on a case-insensitive filesystem) are never
+    written at the same time. After the first failed write no further writes
+    are submitted and queued ones are cancelled.
+
+    Raises:
+        IOError: If any file cannot be written
+    """
+    written_files = []
+    pending: Dict[str, Future[None]] = {}
+    failed: List[Future[None]] = []
 
-        content_parts.append(f"{start_delimiter}\n{file_content}\n{end_delimiter}\n")
+    def record_failure(future: Future[None]) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            failed.append(future)
 
-    return "".join(content_parts)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for filename, file_content in parsed_files:
+                if failed:
+                    break
+                if not written_files:
+                    ensure_directory_exists(output_directory)
+
+                file_path = output_directory / filename
+                path_key = os.path.normpath(file_path).casefold()
+                previous = pending.pop(path_key, None)
+                if previous is not None:
+                    previous.result()
+                elif len(pending) >= _MAX_PENDING_WRITES:
+                    pending.pop(next(iter(pending))).result()
+
+                future = executor.submit(write_file_content, file_path, file_content)
+                future.add_done_callback(record_failure)
+                pending[path_key] = future
+                written_files.append(filename)
+
+            if failed:
+                failed[0].result()
+            for future in pending.values():
+                future.result()
+        except BaseException:
+            # Don't start queued writes once the unpack has failed
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    return written_files
+
+
+def _has_start_delimiter_line(content_bytes: bytes, config: BundlerConfig) -> bool:
+    """Check whether any line, ignoring surrounding whitespace, is a start delimiter.
+
+    Only lines containing the start prefix can match, so they are located with
+    bytes.find and decoded individually instead of splitting the whole content.
+    Each decoded line is split again with str.splitlines, so line boundaries
+    such as a lone carriage return or U+2028 still separate lines.
+    """
+    prefix = config._file_start_prefix_b
+    pos = content_bytes.find(prefix)
+    while pos != -1:
+        line_start = content_bytes.rfind(b"\n", 0, pos) + 1
+        line_end = content_bytes.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(content_bytes)
+
+        line = content_bytes[line_start:line_end].decode("utf-8", errors="replace")
+        if any(is_file_start_delimiter(part.strip(), config) for part in line.splitlines()):
+            return True
+
+        pos = content_bytes.find(prefix, line_end)
+
+    return False
+
+
+def _normalize_crlf_bundle(content_bytes: bytes, config: BundlerConfig) -> bytes:
+    """Translate CRLF line endings back to LF when a whole bundle was converted.
+
+    Packed bundles always end delimiter lines with a bare LF, so a CR before the
+    first start delimiter's LF means the bundle went through a CRLF conversion,
+    such as a Windows checkout, and its byte counts only hold after undoing it.
+    """
+    start = find_next_start_delimiter(content_bytes, 0, config)
+    line_end = content_bytes.find(b"\n", start)
+    if line_end > start and content_bytes[line_end - 1] == 0x0D:
+        return content_bytes.replace(b"\r\n", b"\n")
+
+    return content_bytes
 
 
 def unpack_content(
-    content: str,
+    content: Union[str, bytes],
     output_directory: Path,
-    config: Optional[BundlerConfig] = None,
+    config: BundlerConfig = _DEFAULT_CONFIG,
     file_writer: Optional[FileWriter] = None,
     verify_checksums: bool = False,
-) -> List[Tuple[str, str]]:
+) -> List[str]:
     """Unpack delimited content into individual files.
 
     This function orchestrates the complete unpack workflow from the CLI unpack command.
+    Files are written as they are parsed, so only a bounded number of files are
+    held in memory at a time. With the default writer on a multi-core machine
+    the writes run on a thread pool; a custom file_writer is always called
+    serially in bundle order. A bundle whose line endings were converted to
+    CRLF is translated back to LF before parsing.
 
     Args:
-        content: Concatenated content with delimiters
+        content: Concatenated content with delimiters, as bytes or str
         output_directory: Directory to write files to
         config: Optional configuration for delimiters
         file_writer: Optional custom file writer function
         verify_checksums: Whether to require checksum validation for all files
 
     Returns:
-        List of (filename, content) tuples that were written
+        List of filenames that were written, in bundle order
 
     Raises:
         ValueError: If content contains no valid files or checksum validation fails
         OSError: If output directory cannot be created
         IOError: If files cannot be written
     """
-    if config is None:
-        config = BundlerConfig()
+    content_bytes = content.encode("utf-8") if isinstance(content, str) else content
+    content_bytes = _normalize_crlf_bundle(content_bytes, config)
+    parsed_files = iter_parse_concatenated_content(content_bytes, config, verify_checksums=verify_checksums)
+    write_workers = min(_MAX_WRITE_WORKERS, os.cpu_count() or 1)
+
+    if file_writer is None and write_workers > 1:
+        written_files = _write_files_concurrently(parsed_files, output_directory, write_workers)
+    else:
+        writer = file_writer or write_file_content
+        written_files = []
+        for filename, file_content in parsed_files:
+            if not written_files:
+                ensure_directory_exists(output_directory)
 
-    file_data = parse_concatenated_content(content, config, verify_checksums=verify_checksums)
+            writer(output_directory / filename, file_content)
+            written_files.append(filename)
 
     # Only raise exception if no valid file delimiters were found at all
     # Check if content contains any lines that are valid file delimiters
-    if not file_data:
-        from txtpack.delimiter_processing import is_file_start_delimiter
-
-        lines = content.splitlines()
-        has_any_valid_delimiters = any(is_file_start_delimiter(line.strip(), config) for line in lines)
-
-        if not has_any_valid_delimiters:
+    if not written_files:
+        if not _has_start_delimiter_line(content_bytes, config):
             raise ValueError("No valid file delimiters found in content")
 
-    ensure_directory_exists(output_directory)
-
-    if file_writer:
-        for filename, file_content in file_data:
-            file_path = output_directory / filename
-            file_writer(file_path, file_content)
-    else:
-        from txtpack.file_operations import write_file_content
-
-        for filename, file_content in file_data:
-            file_path = output_directory / filename
-            write_file_content(file_path, file_content)
+        ensure_directory_exists(output_directory)
 
-    return file_data
+    return written_files
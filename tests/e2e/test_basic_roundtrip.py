@@ -202,6 +202,29 @@ class TestBasicRoundTrip:
         reconstructed_file = output_dir / "test.txt"
         assert reconstructed_file.read_text(encoding="utf-8") == test_content
 
+    def test_unpack_bundle_converted_to_crlf(self, temp_dir, cli_runner):
+        """Test a bundle whose line endings were converted to CRLF still unpacks."""
+        # Arrange
+        test_content = "line one\nline two\n"
+        (temp_dir / "test.txt").write_bytes(test_content.encode("utf-8"))
+
+        packed_file = temp_dir / "packed.txt"
+        output_dir = temp_dir / "output"
+        output_dir.mkdir()
+
+        pack_result = cli_runner(["pack", "test.txt"], cwd=temp_dir)
+        assert pack_result.returncode == 0
+        packed_file.write_bytes(pack_result.stdout.replace("\n", "\r\n").encode("utf-8"))
+
+        # Act
+        unpack_result = cli_runner(
+            ["unpack", "--input", str(packed_file), "--output-dir", str(output_dir)], cwd=temp_dir
+        )
+
+        # Assert
+        assert unpack_result.returncode == 0
+        assert (output_dir / "test.txt").read_bytes() == test_content.encode("utf-8")
+
 
 class TestExitCodes:
     """Test CLI exit codes for various scenarios."""
@@ -98,8 +98,7 @@ Legacy file!
         # Should unpack successfully
         result = unpack_content(legacy_content, temp_dir)
 
-        assert len(result) == 1
-        assert result[0] == ("legacy.txt", "Legacy file!")
+        assert result == ["legacy.txt"]
 
         # Check file was written correctly
         restored_file = temp_dir / "legacy.txt"
@@ -65,6 +65,20 @@ class TestPackErrorScenarios:
         # Assert
         assert pack_result.returncode == 1
 
+    def test_pack_non_utf8_file(self, temp_dir, cli_runner):
+        """Test pack refuses a file that unpack could not restore."""
+        # Arrange
+        create_test_file(temp_dir / "a.txt", "content")
+        (temp_dir / "b.txt").write_bytes(b"\xff\xfe not utf-8")
+
+        # Act
+        pack_result = cli_runner(["pack", "*.txt"], cwd=temp_dir)
+
+        # Assert
+        assert pack_result.returncode == 1
+        assert pack_result.stdout == ""
+        assert "not valid UTF-8" in pack_result.stderr
+
 
 class TestUnpackErrorScenarios:
     """Test error handling in unpack command."""
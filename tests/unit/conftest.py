@@ -1,14 +1,21 @@
 """Shared test fixtures and utilities for unit tests."""
 
+import os
 import tempfile
 from pathlib import Path
 from typing import List, Tuple
 
 import pytest
-from hypothesis import strategies as st
+from hypothesis import HealthCheck, settings, strategies as st
 
 from txtpack.cli import BundlerConfig
 
+# Property tests run fewer examples locally; CI selects the thorough profile via HYPOTHESIS_PROFILE=ci.
+# Deadlines are disabled because cold-start timing (imports, regex compilation) causes flaky failures.
+settings.register_profile("fast", max_examples=25, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+settings.register_profile("ci", max_examples=200, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
+
 
 @pytest.fixture
 def default_config():
@@ -16,6 +23,22 @@ def default_config():
     return BundlerConfig()
 
 
+@pytest.fixture(scope="module")
+def custom_hash_config():
+    """Provide a shared BundlerConfig using '###' style delimiters.
+
+    Configs are immutable, so one instance per module is safe to share and
+    builds its compiled pattern once rather than once per test.
+    """
+    return BundlerConfig(
+        file_start_prefix="### START: ",
+        file_start_middle=" [",
+        file_start_bytes_suffix=" bytes] ###",
+        file_end_prefix="### END: ",
+        file_end_suffix=" ###",
+    )
+
+
 @pytest.fixture
 def temp_dir():
     """Provide a temporary directory for test files."""
@@ -2,8 +2,12 @@
 
 from hypothesis import given
 
-from txtpack.content_parsing import parse_concatenated_content
-from txtpack.delimiter_processing import BundlerConfig, create_file_end_delimiter, create_file_start_delimiter
+from txtpack.content_parsing import (
+    index_concatenated_content,
+    iter_parse_concatenated_content,
+    parse_concatenated_content,
+)
+from txtpack.delimiter_processing import create_file_end_delimiter, create_file_start_delimiter
 from txtpack.file_operations import get_file_byte_count
 from .conftest import file_content_strategy, file_list_strategy, filename_strategy
 
@@ -37,6 +41,14 @@ class TestParseConcatenatedContent:
         assert result[0] == ("file1.txt", "Hello")
         assert result[1] == ("file2.json", '{"key": "value"}')
 
+    def test_parse_bytes_content(self):
+        """Test parsing raw bytes content."""
+        content = b"--- FILE: test.txt (13 bytes) ---\nHello, world!\n--- END: test.txt ---\n"
+
+        result = parse_concatenated_content(content)
+
+        assert result == [("test.txt", "Hello, world!")]
+
     def test_parse_empty_content(self):
         """Test parsing empty content."""
         result = parse_concatenated_content("")
@@ -49,6 +61,22 @@ class TestParseConcatenatedContent:
         result = parse_concatenated_content(content)
         assert result == []
 
+    def test_parse_content_with_blank_lines_between_files(self):
+        """Test parsing continues past blank lines between files."""
+        content = (
+            "--- FILE: file1.txt (5 bytes) ---\n"
+            "Hello"
+            "\n--- END: file1.txt ---\n"
+            "\n\n"
+            "--- FILE: file2.txt (5 bytes) ---\n"
+            "World"
+            "\n--- END: file2.txt ---\n"
+        )
+
+        result = parse_concatenated_content(content)
+
+        assert result == [("file1.txt", "Hello"), ("file2.txt", "World")]
+
     def test_parse_empty_file(self):
         """Test parsing content with empty file."""
         content = "--- FILE: empty.txt (0 bytes) ---\n\n--- END: empty.txt ---\n"
@@ -116,19 +144,11 @@ class TestParseConcatenatedContent:
         # Exact behavior depends on implementation, but should not crash
         assert isinstance(result, list)
 
-    def test_parse_custom_config(self):
+    def test_parse_custom_config(self, custom_hash_config):
         """Test parsing with custom delimiter configuration."""
-        config = BundlerConfig(
-            file_start_prefix="### START: ",
-            file_start_middle=" [",
-            file_start_bytes_suffix=" bytes] ###",
-            file_end_prefix="### END: ",
-            file_end_suffix=" ###",
-        )
-
         content = "### START: test.txt [5 bytes] ###\nHello\n### END: test.txt ###\n"
 
-        result = parse_concatenated_content(content, config)
+        result = parse_concatenated_content(content, custom_hash_config)
 
         assert len(result) == 1
         assert result[0] == ("test.txt", "Hello")
@@ -227,3 +247,55 @@ class TestParseConcatenatedContent:
 
         assert len(result) == 1
         assert result[0] == ("unicode.txt", unicode_content)
+
+
+class TestIterParseConcatenatedContent:
+    """Test lazy concatenated content parsing."""
+
+    def test_iter_yields_files_one_at_a_time(self):
+        """Test the iterator yields each file as it is reached."""
+        content = (
+            "--- FILE: file1.txt (5 bytes) ---\n"
+            "Hello"
+            "\n--- END: file1.txt ---\n"
+            "--- FILE: file2.txt (5 bytes) ---\n"
+            "World"
+            "\n--- END: file2.txt ---\n"
+        )
+
+        files = iter_parse_concatenated_content(content)
+
+        assert next(files) == ("file1.txt", "Hello")
+        assert next(files) == ("file2.txt", "World")
+        assert next(files, None) is None
+
+    @given(file_list_strategy())
+    def test_iter_matches_list_parsing(self, file_list):
+        """Property test: the iterator yields exactly what the list parser returns."""
+        content = "".join(
+            f"{create_file_start_delimiter(name, get_file_byte_count(body))}\n{body}\n{create_file_end_delimiter(name)}\n"
+            for name, body in file_list
+        )
+
+        assert list(iter_parse_concatenated_content(content)) == parse_concatenated_content(content)
+
+
+class TestIndexConcatenatedContent:
+    """Test locating files as parallel arrays without decoding content."""
+
+    def test_index_multiple_files(self):
+        """Test filenames and content offsets for multiple files."""
+        content = (
+            b"--- FILE: file1.txt (5 bytes) ---\n"
+            b"Hello"
+            b"\n--- END: file1.txt ---\n"
+            b"--- FILE: file2.txt (5 bytes) ---\n"
+            b"World"
+            b"\n--- END: file2.txt ---\n"
+        )
+
+        filenames, starts, lengths = index_concatenated_content(content)
+
+        assert filenames == ["file1.txt", "file2.txt"]
+        assert starts.typecode == "q" and lengths.typecode == "q"
+        assert [content[start : start + length] for start, length in zip(starts, lengths)] == [b"Hello", b"World"]
@@ -1,17 +1,23 @@
 """Unit tests for delimiter processing module."""
 
+import dataclasses
+import pickle
+
 import pytest
 from hypothesis import given, strategies as st
 
 from txtpack.delimiter_processing import (
     BundlerConfig,
     ChecksumAlgorithm,
+    append_packed_file,
     calculate_file_checksum,
     create_file_end_delimiter,
     create_file_start_delimiter,
     extract_file_content_at_position,
+    extract_file_content_bytes_at_position,
     extract_next_file,
     find_next_line_end,
+    find_next_start_delimiter,
     is_file_end_delimiter,
     is_file_start_delimiter,
     parse_file_start_delimiter,
@@ -50,6 +56,36 @@ class TestBundlerConfig:
         assert config.file_end_prefix == "### END: "
         assert config.file_end_suffix == " ###"
 
+    def test_config_is_immutable(self):
+        """Test configuration cannot be modified after creation."""
+        config = BundlerConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.file_start_prefix = "### START: "  # type: ignore[misc]
+
+    def test_config_is_hashable(self):
+        """Test equal configurations hash equally and work as dict keys."""
+        config = BundlerConfig(checksum_algorithm=ChecksumAlgorithm.MD5)
+
+        assert hash(config) == hash(BundlerConfig(checksum_algorithm=ChecksumAlgorithm.MD5))
+        assert config == BundlerConfig(checksum_algorithm=ChecksumAlgorithm.MD5)
+        assert config != BundlerConfig()
+        assert {config: "value"}[BundlerConfig(checksum_algorithm=ChecksumAlgorithm.MD5)] == "value"
+
+    def test_config_survives_pickling(self):
+        """Test an unpickled configuration equals, hashes like and parses like the original."""
+        config = BundlerConfig(checksum_algorithm=ChecksumAlgorithm.MD5)
+        restored = pickle.loads(pickle.dumps(config))
+
+        assert restored == config
+        assert {config: "value"}.get(restored) == "value"
+        assert parse_file_start_delimiter("--- FILE: a.txt (1 bytes) ---", restored) == ("a.txt", 1, None, None)
+
+    def test_config_uses_slots(self):
+        """Test configuration stores fields in slots rather than an instance dict."""
+        config = BundlerConfig()
+        assert not hasattr(config, "__dict__")
+        assert "_file_start_prefix_b" in BundlerConfig.__slots__
+
     def test_checksum_algorithm_config(self):
         """Test checksum algorithm configuration."""
         config = BundlerConfig(checksum_algorithm=ChecksumAlgorithm.MD5)
@@ -68,14 +104,9 @@ class TestCreateFileStartDelimiter:
         expected = "--- FILE: test.txt (123 bytes) ---"
         assert result == expected
 
-    def test_create_start_delimiter_custom_config(self):
+    def test_create_start_delimiter_custom_config(self, custom_hash_config):
         """Test creating start delimiter with custom config."""
-        config = BundlerConfig(
-            file_start_prefix="### START: ",
-            file_start_middle=" [",
-            file_start_bytes_suffix=" bytes] ###",
-        )
-        result = create_file_start_delimiter("test.txt", 123, config)
+        result = create_file_start_delimiter("test.txt", 123, custom_hash_config)
         expected = "### START: test.txt [123 bytes] ###"
         assert result == expected
 
@@ -108,13 +139,9 @@ class TestCreateFileEndDelimiter:
         expected = "--- END: test.txt ---"
         assert result == expected
 
-    def test_create_end_delimiter_custom_config(self):
+    def test_create_end_delimiter_custom_config(self, custom_hash_config):
         """Test creating end delimiter with custom config."""
-        config = BundlerConfig(
-            file_end_prefix="### END: ",
-            file_end_suffix=" ###",
-        )
-        result = create_file_end_delimiter("test.txt", config)
+        result = create_file_end_delimiter("test.txt", custom_hash_config)
         expected = "### END: test.txt ###"
         assert result == expected
 
@@ -125,46 +152,95 @@ class TestCreateFileEndDelimiter:
         assert is_file_end_delimiter(delimiter, filename)
 
 
+class TestAppendPackedFile:
+    """Test appending delimited file blocks to a pack buffer."""
+
+    def test_append_default_config(self):
+        """Test appended block matches the delimited text format."""
+        buf = bytearray()
+        append_packed_file(buf, "test.txt", b"Hello")
+        assert bytes(buf) == b"--- FILE: test.txt (5 bytes) ---\nHello\n--- END: test.txt ---\n"
+
+    def test_append_multiple_files(self):
+        """Test consecutive blocks are appended in order."""
+        buf = bytearray()
+        append_packed_file(buf, "a.txt", b"A")
+        append_packed_file(buf, "b.txt", b"")
+        assert bytes(buf) == (
+            b"--- FILE: a.txt (1 bytes) ---\nA\n--- END: a.txt ---\n--- FILE: b.txt (0 bytes) ---\n\n--- END: b.txt ---\n"
+        )
+
+    def test_append_with_checksum(self):
+        """Test appended block includes checksum in the start delimiter."""
+        config = BundlerConfig(checksum_algorithm=ChecksumAlgorithm.MD5)
+        buf = bytearray()
+        append_packed_file(buf, "test.txt", b"hello", config, "5d41402abc4b2a76b9719d911017c592")
+        expected_start = create_file_start_delimiter("test.txt", 5, config, "5d41402abc4b2a76b9719d911017c592")
+        assert bytes(buf).startswith(expected_start.encode("utf-8") + b"\n")
+
+    def test_append_custom_config(self, custom_hash_config):
+        """Test appended block uses custom delimiter format."""
+        buf = bytearray()
+        append_packed_file(buf, "test.txt", b"Hello", custom_hash_config)
+        assert bytes(buf) == b"### START: test.txt [5 bytes] ###\nHello\n### END: test.txt ###\n"
+
+    @given(file_content_strategy(), filename_strategy())
+    def test_append_matches_string_delimiters(self, file_content, filename):
+        """Property test: appended block equals the string-built format."""
+        content_bytes = file_content.encode("utf-8")
+        start_delimiter = create_file_start_delimiter(filename, len(content_bytes))
+        end_delimiter = create_file_end_delimiter(filename)
+
+        buf = bytearray()
+        append_packed_file(buf, filename, content_bytes)
+
+        assert bytes(buf) == f"{start_delimiter}\n{file_content}\n{end_delimiter}\n".encode("utf-8")
+
+
 class TestIsFileStartDelimiter:
     """Test file start delimiter detection."""
 
-    def test_valid_start_delimiters(self):
-        """Test detection of valid start delimiters."""
-        valid_delimiters = [
+    @pytest.mark.parametrize(
+        "delimiter",
+        [
             "--- FILE: test.txt (123 bytes) ---",
             "--- FILE: data.json (0 bytes) ---",
             "--- FILE: my-file.py (999999 bytes) ---",
-        ]
-
-        for delimiter in valid_delimiters:
-            assert is_file_start_delimiter(delimiter), f"Should be valid: {delimiter}"
+        ],
+    )
+    def test_valid_start_delimiters(self, delimiter):
+        """Test detection of valid start delimiters."""
+        assert is_file_start_delimiter(delimiter)
 
-    def test_invalid_start_delimiters(self):
-        """Test detection of invalid start delimiters."""
-        invalid_delimiters = [
+    @pytest.mark.parametrize(
+        "delimiter",
+        [
             "regular text",
             "--- FILE: test.txt",  # Missing byte info
             "FILE: test.txt (123 bytes) ---",  # Missing prefix
             "--- FILE: test.txt (123 bytes)",  # Missing suffix
             "--- END: test.txt ---",  # End delimiter
-        ]
-
-        for delimiter in invalid_delimiters:
-            assert not is_file_start_delimiter(delimiter), f"Should be invalid: {delimiter}"
+            "--- FILE: test.txt (123 bytes) --- trailing",  # Trailing text
+        ],
+    )
+    def test_invalid_start_delimiters(self, delimiter):
+        """Test detection of invalid start delimiters."""
+        assert not is_file_start_delimiter(delimiter)
 
-    def test_start_delimiter_custom_config(self):
+    def test_start_delimiter_custom_config(self, custom_hash_config):
         """Test start delimiter detection with custom config."""
-        config = BundlerConfig(
-            file_start_prefix="### START: ",
-            file_start_middle=" [",
-            file_start_bytes_suffix=" bytes] ###",
-        )
-
         valid_delimiter = "### START: test.txt [123 bytes] ###"
         invalid_delimiter = "--- FILE: test.txt (123 bytes) ---"
 
-        assert is_file_start_delimiter(valid_delimiter, config)
-        assert not is_file_start_delimiter(invalid_delimiter, config)
+        assert is_file_start_delimiter(valid_delimiter, custom_hash_config)
+        assert not is_file_start_delimiter(invalid_delimiter, custom_hash_config)
+
+    def test_start_delimiter_custom_config_with_appended_checksum(self, custom_hash_config):
+        """Test a checksum appended after a custom suffix is still detected."""
+        delimiter = "### START: test.txt [123 bytes] ### [md5:abc123]"
+
+        assert is_file_start_delimiter(delimiter, custom_hash_config)
+        assert not is_file_start_delimiter(delimiter + " trailing", custom_hash_config)
 
 
 class TestParseFileStartDelimiter:
@@ -194,33 +270,57 @@ class TestParseFileStartDelimiter:
         assert filename == "large.txt"
         assert byte_count == 999999
 
-    def test_parse_invalid_delimiters(self):
-        """Test error handling for invalid delimiters."""
-        invalid_delimiters = [
+    @pytest.mark.parametrize(
+        "delimiter",
+        [
             "regular text",
             "--- FILE: test.txt",
             "--- FILE: test.txt (abc bytes) ---",
             "--- FILE: test.txt (123 bytes",
-        ]
+            "--- FILE: test.txt (123 bytes) ---\r",
+        ],
+    )
+    def test_parse_invalid_delimiters(self, delimiter):
+        """Test error handling for invalid delimiters."""
+        with pytest.raises(ValueError):
+            parse_file_start_delimiter(delimiter)
 
-        for delimiter in invalid_delimiters:
-            with pytest.raises(ValueError):
-                parse_file_start_delimiter(delimiter)
+    def test_parse_rejects_non_ascii_digits(self):
+        """Test byte counts must use ASCII digits."""
+        delimiter = "--- FILE: test.txt (\u0661\u0662\u0663 bytes) ---"
 
-    def test_parse_custom_config(self):
-        """Test parsing with custom config."""
-        config = BundlerConfig(
-            file_start_prefix="### START: ",
-            file_start_middle=" [",
-            file_start_bytes_suffix=" bytes] ###",
-        )
+        assert not is_file_start_delimiter(delimiter)
+        with pytest.raises(ValueError, match="Not a valid start delimiter"):
+            parse_file_start_delimiter(delimiter)
 
+    def test_parse_custom_config(self, custom_hash_config):
+        """Test parsing with custom config."""
         delimiter = "### START: test.txt [123 bytes] ###"
-        filename, byte_count, _, _ = parse_file_start_delimiter(delimiter, config)
+        filename, byte_count, _, _ = parse_file_start_delimiter(delimiter, custom_hash_config)
 
         assert filename == "test.txt"
         assert byte_count == 123
 
+    @pytest.mark.parametrize(
+        "delimiter,expected",
+        [
+            ("--- FILE: a (1).txt (5 bytes) ---", ("a (1).txt", 5, None, None)),
+            ("--- FILE: a (2 bytes) ---.txt (5 bytes) ---", ("a (2 bytes) ---.txt", 5, None, None)),
+            ("--- FILE: a (1) (5 bytes) [md5:abc123] ---", ("a (1)", 5, "abc123", ChecksumAlgorithm.MD5)),
+        ],
+    )
+    def test_parse_filename_containing_middle(self, delimiter, expected):
+        """Test filenames containing the middle delimiter split at its last occurrence."""
+        assert parse_file_start_delimiter(delimiter) == expected
+
+    def test_parse_custom_config_filename_containing_middle(self, custom_hash_config):
+        """Test custom configs whose middle can recur in the suffix split at the first match."""
+        delimiter = "### START: a [1].txt [123 bytes] ###"
+        filename, byte_count, _, _ = parse_file_start_delimiter(delimiter, custom_hash_config)
+
+        assert filename == "a [1].txt"
+        assert byte_count == 123
+
 
 class TestIsFileEndDelimiter:
     """Test file end delimiter detection."""
@@ -235,31 +335,27 @@ class TestIsFileEndDelimiter:
         delimiter = "--- END: test.txt ---"
         assert not is_file_end_delimiter(delimiter, "other.txt")
 
-    def test_invalid_end_delimiter(self):
-        """Test detection of invalid end delimiter."""
-        invalid_delimiters = [
+    @pytest.mark.parametrize(
+        "delimiter",
+        [
             "regular text",
             "--- FILE: test.txt (123 bytes) ---",  # Start delimiter
             "--- END: test.txt",  # Missing suffix
             "END: test.txt ---",  # Missing prefix
-        ]
-
-        for delimiter in invalid_delimiters:
-            assert not is_file_end_delimiter(delimiter, "test.txt")
+        ],
+    )
+    def test_invalid_end_delimiter(self, delimiter):
+        """Test detection of invalid end delimiter."""
+        assert not is_file_end_delimiter(delimiter, "test.txt")
 
-    def test_end_delimiter_custom_config(self):
+    def test_end_delimiter_custom_config(self, custom_hash_config):
         """Test end delimiter detection with custom config."""
-        config = BundlerConfig(
-            file_end_prefix="### END: ",
-            file_end_suffix=" ###",
-        )
-
         delimiter = "### END: test.txt ###"
-        assert is_file_end_delimiter(delimiter, "test.txt", config)
+        assert is_file_end_delimiter(delimiter, "test.txt", custom_hash_config)
 
         # Default format should not match
         default_delimiter = "--- END: test.txt ---"
-        assert not is_file_end_delimiter(default_delimiter, "test.txt", config)
+        assert not is_file_end_delimiter(default_delimiter, "test.txt", custom_hash_config)
 
 
 class TestFindNextLineEnd:
@@ -287,6 +383,41 @@ class TestFindNextLineEnd:
         assert find_next_line_end(content, 0) == 0
 
 
+class TestFindNextStartDelimiter:
+    """Test start delimiter candidate search."""
+
+    def test_find_delimiter_at_position(self):
+        """Test candidate found at the current position."""
+        content = b"--- FILE: test.txt (5 bytes) ---\nHello"
+        assert find_next_start_delimiter(content, 0) == 0
+
+    def test_find_delimiter_after_other_lines(self):
+        """Test skipping non-delimiter lines to the next candidate."""
+        content = b"line1\nline2\n--- FILE: test.txt (5 bytes) ---\nHello"
+        assert find_next_start_delimiter(content, 0) == len(b"line1\nline2\n")
+
+    def test_prefix_not_at_line_start_ignored(self):
+        """Test prefix occurring mid-line is not a candidate."""
+        content = b"text --- FILE: a.txt (1 bytes) ---\n--- FILE: b.txt (1 bytes) ---\n"
+        assert find_next_start_delimiter(content, 0) == content.index(b"\n") + 1
+
+    def test_position_treated_as_line_start(self):
+        """Test a candidate at a nonzero search position is found without a preceding newline."""
+        content = b"Hello--- FILE: b.txt (1 bytes) ---\nB"
+        assert find_next_start_delimiter(content, 5) == 5
+
+    def test_no_delimiter_returns_end(self):
+        """Test end of content returned when no candidate exists."""
+        content = b"regular content\nno delimiters here"
+        assert find_next_start_delimiter(content, 0) == len(content)
+
+    def test_find_with_custom_config(self):
+        """Test candidate search with custom config."""
+        config = BundlerConfig(file_start_prefix="### START: ")
+        content = b"--- FILE: a.txt (1 bytes) ---\n### START: b.txt [1 bytes] ###\n"
+        assert find_next_start_delimiter(content, 0, config) == content.index(b"###")
+
+
 class TestExtractFileContentAtPosition:
     """Test file content extraction functionality."""
 
@@ -354,19 +485,47 @@ class TestExtractFileContentAtPosition:
         assert new_pos == byte_count
 
 
+class TestExtractFileContentBytesAtPosition:
+    """Test zero-copy file content extraction."""
+
+    def test_extract_returns_view_of_content(self):
+        """Test extraction returns a view into the original buffer."""
+        content_bytes = b"headerHello, world!trailer"
+
+        content_view, new_pos = extract_file_content_bytes_at_position(content_bytes, 6, "test.txt", 13)
+
+        assert isinstance(content_view, memoryview)
+        assert content_view.obj is content_bytes
+        assert content_view == b"Hello, world!"
+        assert new_pos == 19
+
+    def test_extract_invalid_utf8_not_decoded(self):
+        """Test raw bytes are returned without UTF-8 validation."""
+        content_view, new_pos = extract_file_content_bytes_at_position(b"\xff\xfe\xfd", 0, "test.txt", 3)
+
+        assert content_view == b"\xff\xfe\xfd"
+        assert new_pos == 3
+
+    def test_extract_insufficient_content(self):
+        """Test error when not enough content available."""
+        with pytest.raises(ValueError, match="Not enough content"):
+            extract_file_content_bytes_at_position(b"short", 0, "test.txt", 10)
+
+
 class TestSkipEndDelimiter:
     """Test end delimiter skipping functionality."""
 
+    CONTENT = b"file content\n--- END: test.txt ---\nmore content"
+    # Position after the end delimiter and its newline
+    EXPECTED_POS = len(b"file content\n--- END: test.txt ---\n")
+
     def test_skip_valid_end_delimiter(self):
         """Test skipping valid end delimiter."""
-        content = b"file content\n--- END: test.txt ---\nmore content"
         pos = 13  # After "file content\n"
 
-        new_pos = skip_end_delimiter(content, pos, "test.txt")
+        new_pos = skip_end_delimiter(self.CONTENT, pos, "test.txt")
 
-        # Should be positioned after the end delimiter and newline
-        expected_pos = len(b"file content\n--- END: test.txt ---\n")
-        assert new_pos == expected_pos
+        assert new_pos == self.EXPECTED_POS
 
     def test_skip_missing_end_delimiter(self):
         """Test skipping when end delimiter is missing."""
@@ -378,6 +537,23 @@ class TestSkipEndDelimiter:
         # Should remain at original position when delimiter not found
         assert new_pos == pos
 
+    def test_skip_end_delimiter_with_trailing_text(self):
+        """Test end delimiter followed by more text on the same line is not skipped."""
+        content = b"file content\n--- END: test.txt --- extra\nmore content"
+        pos = 13
+
+        new_pos = skip_end_delimiter(content, pos, "test.txt")
+
+        assert new_pos == pos
+
+    def test_skip_end_delimiter_at_end_without_newline(self):
+        """Test end delimiter on the last line without a trailing newline."""
+        content = b"file content\n--- END: test.txt ---"
+
+        new_pos = skip_end_delimiter(content, 13, "test.txt")
+
+        assert new_pos >= len(content)
+
     def test_skip_at_end_of_content(self):
         """Test skipping when at end of content."""
         content = b"file content"
@@ -387,16 +563,12 @@ class TestSkipEndDelimiter:
 
         assert new_pos == pos
 
-    def test_skip_with_custom_config(self):
+    def test_skip_with_custom_config(self, custom_hash_config):
         """Test skipping with custom config."""
-        config = BundlerConfig(
-            file_end_prefix="### END: ",
-            file_end_suffix=" ###",
-        )
         content = b"file content\n### END: test.txt ###\nmore content"
         pos = 13
 
-        new_pos = skip_end_delimiter(content, pos, "test.txt", config)
+        new_pos = skip_end_delimiter(content, pos, "test.txt", custom_hash_config)
 
         expected_pos = len(b"file content\n### END: test.txt ###\n")
         assert new_pos == expected_pos
@@ -441,7 +613,16 @@ class TestExtractNextFile:
         file_data, new_pos = extract_next_file(content, 0)
 
         assert file_data is None
-        assert new_pos > 0  # Should advance position
+        assert new_pos == len(content)  # Jumps straight past content with no candidates
+
+    def test_extract_skips_leading_content(self):
+        """Test extraction jumps over content preceding the next delimiter."""
+        content = b"preamble\n\nmore text\n--- FILE: test.txt (5 bytes) ---\nHello\n--- END: test.txt ---\n"
+
+        file_data, new_pos = extract_next_file(content, 0)
+
+        assert file_data == ("test.txt", "Hello")
+        assert new_pos == len(content)
 
     def test_extract_invalid_delimiter(self):
         """Test extraction with invalid delimiter."""
@@ -450,7 +631,17 @@ class TestExtractNextFile:
         file_data, new_pos = extract_next_file(content, 0)
 
         assert file_data is None
-        assert new_pos > 0  # Should skip invalid line
+        assert new_pos == len(content)  # No further candidate after the invalid line
+
+    def test_extract_invalid_delimiter_jumps_to_next_candidate(self):
+        """Test an invalid header resumes at the next delimiter line."""
+        valid = b"--- FILE: test.txt (5 bytes) ---\nHello\n--- END: test.txt ---\n"
+        content = b"--- FILE: invalid (abc bytes) ---\nfiller\nmore filler\n" + valid
+
+        file_data, new_pos = extract_next_file(content, 0)
+
+        assert file_data is None
+        assert new_pos == len(content) - len(valid)
 
     def test_extract_at_end_of_content(self):
         """Test extraction at end of content."""
@@ -465,12 +656,12 @@ class TestExtractNextFile:
     @given(file_content_strategy(), filename_strategy())
     def test_extract_file_property(self, file_content, filename):
         """Property test: extracting properly formatted content should work."""
-        # Create properly formatted content
-        byte_count = len(file_content.encode("utf-8"))
-        start_delimiter = create_file_start_delimiter(filename, byte_count)
-        end_delimiter = create_file_end_delimiter(filename)
+        # Create properly formatted content, encoding the file content only once
+        encoded = file_content.encode("utf-8")
+        start_delimiter = create_file_start_delimiter(filename, len(encoded)).encode("utf-8")
+        end_delimiter = create_file_end_delimiter(filename).encode("utf-8")
 
-        content = f"{start_delimiter}\n{file_content}\n{end_delimiter}\n".encode("utf-8")
+        content = start_delimiter + b"\n" + encoded + b"\n" + end_delimiter + b"\n"
 
         file_data, new_pos = extract_next_file(content, 0)
 
@@ -543,6 +734,15 @@ class TestCalculateFileChecksum:
         assert all(c in "0123456789abcdef" for c in md5_checksum)
         assert all(c in "0123456789abcdef" for c in sha256_checksum)
 
+    def test_bytes_content_matches_str(self):
+        """Test encoded bytes hash the same as the equivalent string."""
+        content = "Hello 世界"
+
+        for algorithm in (ChecksumAlgorithm.MD5, ChecksumAlgorithm.SHA256):
+            assert calculate_file_checksum(content.encode("utf-8"), algorithm) == calculate_file_checksum(
+                content, algorithm
+            )
+
 
 class TestValidateFileChecksum:
     """Test checksum validation function."""
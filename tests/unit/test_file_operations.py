@@ -17,7 +17,9 @@ from hypothesis import given
 from txtpack.file_operations import (
     ensure_directory_exists,
     get_file_byte_count,
+    read_file_bytes,
     read_file_content,
+    read_input_bytes,
     read_input_content,
     read_multiple_files,
     write_file_content,
@@ -62,6 +64,30 @@ class TestReadFileContent:
             read_file_content(nonexistent_file)
 
 
+class TestReadFileBytes:
+    """Test raw byte file reading functionality."""
+
+    def test_read_bytes_preserves_line_endings(self, temp_dir):
+        """Test raw read keeps CRLF line endings untouched."""
+        test_file = temp_dir / "crlf.txt"
+        test_file.write_bytes(b"line1\r\nline2\r\n")
+
+        assert read_file_bytes(test_file) == b"line1\r\nline2\r\n"
+
+    def test_read_bytes_unicode_file(self, temp_dir):
+        """Test raw read returns UTF-8 encoded bytes."""
+        test_file = temp_dir / "unicode.txt"
+        unicode_content = "Hello 🌍! 测试 content"
+        test_file.write_text(unicode_content, encoding="utf-8")
+
+        assert read_file_bytes(test_file) == unicode_content.encode("utf-8")
+
+    def test_read_bytes_nonexistent_file(self, temp_dir):
+        """Test error handling for nonexistent file."""
+        with pytest.raises(IOError, match="Failed to read file"):
+            read_file_bytes(temp_dir / "does_not_exist.txt")
+
+
 class TestWriteFileContent:
     """Test file writing functionality."""
 
@@ -143,6 +169,41 @@ class TestReadInputContent:
             read_input_content("/does/not/exist.txt")
 
 
+class TestReadInputBytes:
+    """Test raw input reading functionality."""
+
+    def test_read_bytes_from_file(self, temp_dir):
+        """Test reading bytes from specified file."""
+        test_file = temp_dir / "input.txt"
+        test_file.write_bytes(b"Input file content")
+
+        assert read_input_bytes(str(test_file)) == b"Input file content"
+
+    def test_read_bytes_from_stdin_with_reader(self):
+        """Test reading bytes from stdin using custom reader."""
+        mock_stdin_reader = Mock(return_value=b"stdin content")
+
+        result = read_input_bytes(stdin_reader=mock_stdin_reader)
+
+        assert result == b"stdin content"
+        mock_stdin_reader.assert_called_once()
+
+    @patch("txtpack.file_operations.sys.stdin")
+    def test_read_bytes_from_stdin_default(self, mock_stdin):
+        """Test reading bytes from the stdin binary buffer."""
+        mock_stdin.buffer.read.return_value = b"default stdin content"
+
+        result = read_input_bytes()
+
+        assert result == b"default stdin content"
+        mock_stdin.buffer.read.assert_called_once()
+
+    def test_read_bytes_nonexistent_input_file(self):
+        """Test error handling for nonexistent input file."""
+        with pytest.raises(IOError):
+            read_input_bytes("/does/not/exist.txt")
+
+
 class TestGetFileByteCount:
     """Test byte count calculation."""
 
@@ -1,13 +1,18 @@
 """Unit tests for pipeline orchestration module."""
 
+import dataclasses
+import io
+import os
+import time
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 from txtpack.delimiter_processing import BundlerConfig, ChecksumAlgorithm
-from txtpack.pipeline import pack_files, unpack_content
-from .conftest import create_test_files
+from txtpack import pipeline
+from txtpack.pipeline import iter_pack_chunks, pack_files, unpack_content, write_packed_files
+from .conftest import assert_files_identical, create_test_files
 
 
 class TestPackFiles:
@@ -54,20 +59,12 @@ class TestPackFiles:
         with pytest.raises(FileNotFoundError):
             pack_files("*", nonexistent_dir)
 
-    def test_pack_with_custom_config(self, temp_dir):
+    def test_pack_with_custom_config(self, temp_dir, custom_hash_config):
         """Test packing with custom delimiter configuration."""
-        config = BundlerConfig(
-            file_start_prefix="### START: ",
-            file_start_middle=" [",
-            file_start_bytes_suffix=" bytes] ###",
-            file_end_prefix="### END: ",
-            file_end_suffix=" ###",
-        )
-
         test_file = temp_dir / "test.txt"
         test_file.write_text("Hello", encoding="utf-8")
 
-        result = pack_files("test.txt", temp_dir, config)
+        result = pack_files("test.txt", temp_dir, custom_hash_config)
 
         assert "### START: test.txt [5 bytes] ###" in result
         assert "Hello" in result
@@ -112,6 +109,85 @@ class TestPackFiles:
         assert unicode_content in result
 
 
+class TestIterPackChunks:
+    """Test streaming pack chunk generation."""
+
+    def test_one_chunk_per_file(self, temp_dir):
+        """Test each matching file yields its own delimited block."""
+        (temp_dir / "file1.txt").write_text("Content 1", encoding="utf-8")
+        (temp_dir / "file2.txt").write_text("Content 2", encoding="utf-8")
+
+        chunks = list(iter_pack_chunks("*.txt", temp_dir))
+
+        assert chunks == [
+            b"--- FILE: file1.txt (9 bytes) ---\nContent 1\n--- END: file1.txt ---\n",
+            b"--- FILE: file2.txt (9 bytes) ---\nContent 2\n--- END: file2.txt ---\n",
+        ]
+
+    def test_chunks_match_pack_files(self, temp_dir):
+        """Test joined chunks equal the pack_files output."""
+        create_test_files(temp_dir, [("a.txt", "Hello 🌍"), ("b.md", "# Title\n")])
+
+        joined = b"".join(iter_pack_chunks("*", temp_dir)).decode("utf-8")
+
+        assert joined == pack_files("*", temp_dir)
+
+    def test_preserves_raw_bytes(self, temp_dir):
+        """Test files are packed verbatim, including CRLF line endings."""
+        (temp_dir / "crlf.txt").write_bytes(b"line1\r\nline2\r\n")
+
+        chunks = list(iter_pack_chunks("*.txt", temp_dir))
+
+        assert chunks == [b"--- FILE: crlf.txt (14 bytes) ---\nline1\r\nline2\r\n\n--- END: crlf.txt ---\n"]
+
+    def test_rejects_non_utf8_content(self, temp_dir):
+        """Test files that unpack could not decode are refused rather than packed."""
+        (temp_dir / "binary.txt").write_bytes(b"\xff\xfe data")
+
+        with pytest.raises(IOError, match="not valid UTF-8"):
+            list(iter_pack_chunks("*.txt", temp_dir))
+
+    def test_no_matching_files(self, temp_dir):
+        """Test error raised when iteration starts and nothing matches."""
+        with pytest.raises(ValueError, match="No files found"):
+            next(iter_pack_chunks("*.nonexistent", temp_dir))
+
+
+class TestWritePackedFiles:
+    """Test writing packed output to a binary stream."""
+
+    def test_write_returns_file_count(self, temp_dir):
+        """Test written output and returned file count."""
+        (temp_dir / "file1.txt").write_text("Content 1", encoding="utf-8")
+        (temp_dir / "file2.txt").write_text("Content 2", encoding="utf-8")
+        output = io.BytesIO()
+
+        file_count = write_packed_files("*.txt", temp_dir, output)
+
+        assert file_count == 2
+        assert output.getvalue().decode("utf-8") == pack_files("*.txt", temp_dir)
+
+    def test_write_no_matching_files(self, temp_dir):
+        """Test nothing is written when no files match."""
+        output = io.BytesIO()
+
+        with pytest.raises(ValueError, match="No files found"):
+            write_packed_files("*.nonexistent", temp_dir, output)
+
+        assert output.getvalue() == b""
+
+    def test_write_nothing_when_a_later_file_fails(self, temp_dir):
+        """Test a file that cannot be packed leaves no partial bundle behind."""
+        (temp_dir / "a.txt").write_text("Content A", encoding="utf-8")
+        (temp_dir / "b.txt").write_bytes(b"\xff\xfe data")
+        output = io.BytesIO()
+
+        with pytest.raises(IOError, match="not valid UTF-8"):
+            write_packed_files("*.txt", temp_dir, output)
+
+        assert output.getvalue() == b""
+
+
 class TestUnpackContent:
     """Test content unpacking pipeline functionality."""
 
@@ -121,9 +197,8 @@ class TestUnpackContent:
 
         result = unpack_content(content, temp_dir)
 
-        # Should return file data
-        assert len(result) == 1
-        assert result[0] == ("test.txt", "Hello, world!")
+        # Should return written filenames
+        assert result == ["test.txt"]
 
         # Should create actual file
         output_file = temp_dir / "test.txt"
@@ -143,15 +218,44 @@ class TestUnpackContent:
 
         result = unpack_content(content, temp_dir)
 
-        # Should return both files
-        assert len(result) == 2
-        assert result[0] == ("file1.txt", "Content 1")
-        assert result[1] == ("file2.txt", "Content 2")
+        # Should return both files in bundle order
+        assert result == ["file1.txt", "file2.txt"]
 
         # Should create actual files
         assert (temp_dir / "file1.txt").read_text(encoding="utf-8") == "Content 1"
         assert (temp_dir / "file2.txt").read_text(encoding="utf-8") == "Content 2"
 
+    def test_unpack_bytes_content(self, temp_dir):
+        """Test unpacking raw bytes input without decoding it up front."""
+        content = "--- FILE: unicode.txt (18 bytes) ---\nHello 🌍! 测试\n--- END: unicode.txt ---\n".encode("utf-8")
+
+        result = unpack_content(content, temp_dir)
+
+        assert result == ["unicode.txt"]
+        assert (temp_dir / "unicode.txt").read_text(encoding="utf-8") == "Hello 🌍! 测试"
+
+    def test_unpack_crlf_converted_bundle(self, temp_dir):
+        """Test a bundle converted to CRLF line endings is translated back before parsing."""
+        content = b"--- FILE: test.txt (11 bytes) ---\r\nline1\r\nline2\r\n--- END: test.txt ---\r\n"
+
+        result = unpack_content(content, temp_dir)
+
+        assert result == ["test.txt"]
+        assert (temp_dir / "test.txt").read_bytes() == b"line1\nline2"
+
+    def test_unpack_keeps_crlf_content_in_lf_bundle(self, temp_dir):
+        """Test CRLF file content is left alone when the delimiters use LF."""
+        content = b"--- FILE: test.txt (12 bytes) ---\nline1\r\nline2\n--- END: test.txt ---\n"
+
+        unpack_content(content, temp_dir)
+
+        assert (temp_dir / "test.txt").read_bytes() == b"line1\r\nline2"
+
+    def test_unpack_invalid_bytes_content(self, temp_dir):
+        """Test error when bytes content has no valid delimiters."""
+        with pytest.raises(ValueError, match="No valid file delimiters"):
+            unpack_content(b"\xff\xfe not a bundle\n", temp_dir)
+
     def test_unpack_empty_content(self, temp_dir):
         """Test error when content is empty."""
         with pytest.raises(ValueError, match="No valid file delimiters"):
@@ -164,6 +268,21 @@ class TestUnpackContent:
         with pytest.raises(ValueError, match="No valid file delimiters"):
             unpack_content(content, temp_dir)
 
+    def test_unpack_truncated_file_returns_empty(self, temp_dir):
+        """Test a valid delimiter with missing content is not reported as invalid input."""
+        content = "preamble\n  --- FILE: test.txt (50 bytes) ---  \nshort\n"
+
+        result = unpack_content(content, temp_dir)
+
+        assert result == []
+        assert not (temp_dir / "test.txt").exists()
+
+    def test_unpack_truncated_file_after_carriage_return(self, temp_dir):
+        """Test a delimiter separated only by a carriage return still counts as a delimiter line."""
+        content = "preamble\r--- FILE: test.txt (50 bytes) ---\rshort"
+
+        assert unpack_content(content, temp_dir) == []
+
     def test_unpack_to_nonexistent_directory(self, temp_dir):
         """Test unpacking to nonexistent directory (should create it)."""
         nested_dir = temp_dir / "new" / "nested" / "dir"
@@ -174,23 +293,15 @@ class TestUnpackContent:
         # Should create directory and file
         assert nested_dir.exists()
         assert (nested_dir / "test.txt").read_text(encoding="utf-8") == "Hello"
-        assert result == [("test.txt", "Hello")]
+        assert result == ["test.txt"]
 
-    def test_unpack_with_custom_config(self, temp_dir):
+    def test_unpack_with_custom_config(self, temp_dir, custom_hash_config):
         """Test unpacking with custom delimiter configuration."""
-        config = BundlerConfig(
-            file_start_prefix="### START: ",
-            file_start_middle=" [",
-            file_start_bytes_suffix=" bytes] ###",
-            file_end_prefix="### END: ",
-            file_end_suffix=" ###",
-        )
-
         content = "### START: test.txt [5 bytes] ###\nHello\n### END: test.txt ###\n"
 
-        result = unpack_content(content, temp_dir, config)
+        result = unpack_content(content, temp_dir, custom_hash_config)
 
-        assert result == [("test.txt", "Hello")]
+        assert result == ["test.txt"]
         assert (temp_dir / "test.txt").read_text(encoding="utf-8") == "Hello"
 
     def test_unpack_with_custom_writer(self, temp_dir):
@@ -202,7 +313,7 @@ class TestUnpackContent:
         result = unpack_content(content, temp_dir, file_writer=mock_writer)
 
         # Should call custom writer
-        assert result == [("test.txt", "Hello")]
+        assert result == ["test.txt"]
         mock_writer.assert_called_once_with(temp_dir / "test.txt", "Hello")
 
     def test_unpack_empty_file(self, temp_dir):
@@ -211,7 +322,7 @@ class TestUnpackContent:
 
         result = unpack_content(content, temp_dir)
 
-        assert result == [("empty.txt", "")]
+        assert result == ["empty.txt"]
         assert (temp_dir / "empty.txt").read_text(encoding="utf-8") == ""
 
     def test_unpack_unicode_content(self, temp_dir):
@@ -223,10 +334,105 @@ class TestUnpackContent:
 
         result = unpack_content(content, temp_dir)
 
-        assert result == [("unicode.txt", unicode_content)]
+        assert result == ["unicode.txt"]
         assert (temp_dir / "unicode.txt").read_text(encoding="utf-8") == unicode_content
 
 
+class TestUnpackContentConcurrentWrites:
+    """Test thread pool writes used by unpack_content on multi-core machines."""
+
+    @pytest.fixture(autouse=True)
+    def multi_core(self, monkeypatch):
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+    def test_writes_all_files_in_bundle_order(self, temp_dir):
+        """Test more files than the pending-write bound are all written."""
+        file_data = [(f"file{i:03d}.txt", f"Content {i}") for i in range(300)]
+        create_test_files(temp_dir, file_data)
+        content = pack_files("*.txt", temp_dir)
+        output_dir = temp_dir / "output"
+
+        result = unpack_content(content, output_dir)
+
+        assert result == [filename for filename, _ in file_data]
+        assert_files_identical(file_data, output_dir)
+
+    def test_duplicate_filename_last_copy_wins(self, temp_dir):
+        """Test a repeated filename ends with the content written last."""
+        content = (
+            "--- FILE: dup.txt (5 bytes) ---\nfirst\n--- END: dup.txt ---\n"
+            "--- FILE: dup.txt (6 bytes) ---\nsecond\n--- END: dup.txt ---\n"
+        )
+
+        result = unpack_content(content, temp_dir)
+
+        assert result == ["dup.txt", "dup.txt"]
+        assert (temp_dir / "dup.txt").read_text(encoding="utf-8") == "second"
+
+    def test_write_error_propagates(self, temp_dir):
+        """Test a failed write is raised to the caller."""
+        (temp_dir / "blocked.txt").mkdir()
+        content = "--- FILE: blocked.txt (5 bytes) ---\nHello\n--- END: blocked.txt ---\n"
+
+        with pytest.raises(IOError, match="Failed to write file"):
+            unpack_content(content, temp_dir)
+
+    def test_same_path_under_different_names_last_copy_wins(self, temp_dir, monkeypatch):
+        """Test names resolving to one output path are written in bundle order."""
+        real_write = pipeline.write_file_content
+
+        def slow_first_write(file_path, content):
+            if content == "first":
+                time.sleep(0.05)
+            real_write(file_path, content)
+
+        monkeypatch.setattr(pipeline, "write_file_content", slow_first_write)
+        content = (
+            "--- FILE: dup.txt (5 bytes) ---\nfirst\n--- END: dup.txt ---\n"
+            "--- FILE: ./dup.txt (6 bytes) ---\nsecond\n--- END: ./dup.txt ---\n"
+        )
+
+        unpack_content(content, temp_dir)
+
+        assert (temp_dir / "dup.txt").read_text(encoding="utf-8") == "second"
+
+    def test_write_error_stops_later_writes(self, temp_dir, monkeypatch):
+        """Test no new writes are started once a write has failed."""
+        written = []
+
+        def failing_first_write(file_path, content):
+            if file_path.name == "file000.txt":
+                raise IOError(f"Failed to write file {file_path}")
+            time.sleep(0.01)
+            written.append(file_path.name)
+
+        monkeypatch.setattr(pipeline, "write_file_content", failing_first_write)
+        content = "".join(
+            f"--- FILE: file{i:03d}.txt (1 bytes) ---\nx\n--- END: file{i:03d}.txt ---\n" for i in range(1000)
+        )
+
+        with pytest.raises(IOError, match="Failed to write file"):
+            unpack_content(content, temp_dir)
+
+        # Only writes already running when the failure is seen may finish, not the queued backlog
+        assert len(written) < 50
+
+    def test_custom_writer_called_serially(self, temp_dir):
+        """Test a custom writer is still called in bundle order."""
+        mock_writer = Mock()
+        content = (
+            "--- FILE: a.txt (1 bytes) ---\nA\n--- END: a.txt ---\n"
+            "--- FILE: b.txt (1 bytes) ---\nB\n--- END: b.txt ---\n"
+        )
+
+        unpack_content(content, temp_dir, file_writer=mock_writer)
+
+        assert [call.args for call in mock_writer.call_args_list] == [
+            (temp_dir / "a.txt", "A"),
+            (temp_dir / "b.txt", "B"),
+        ]
+
+
 class TestPackUnpackRoundTrip:
     """Test round-trip compatibility between pack and unpack."""
 
@@ -305,8 +511,8 @@ Hello
 """
 
         result = unpack_content(content, temp_dir)
-        assert len(result) == 1
-        assert result[0] == ("test.txt", "Hello")
+        assert result == ["test.txt"]
+        assert (temp_dir / "test.txt").read_text(encoding="utf-8") == "Hello"
 
     def test_unpack_with_verify_checksums_required(self, temp_dir):
         """Test unpacking with verify_checksums=True requires checksums."""
@@ -317,3 +523,21 @@ Hello
 
         result = unpack_content(content, temp_dir, verify_checksums=True)
         assert len(result) == 0  # Should fail due to missing checksum
+
+    def test_round_trip_custom_config_with_checksums(self, temp_dir, custom_hash_config):
+        """Test checksums appended after a custom suffix are parsed and verified on unpack."""
+        config = dataclasses.replace(custom_hash_config, checksum_algorithm=ChecksumAlgorithm.MD5)
+        source_dir = temp_dir / "source"
+        source_dir.mkdir()
+        (source_dir / "a.txt").write_text("Hello", encoding="utf-8")
+
+        packed = pack_files("*.txt", source_dir, config)
+        assert "### START: a.txt [5 bytes] ### [md5:8b1a9953c4611296a827abf8c47804d7]" in packed
+
+        output_dir = temp_dir / "output"
+        result = unpack_content(packed, output_dir, config, verify_checksums=True)
+        assert result == ["a.txt"]
+        assert (output_dir / "a.txt").read_text(encoding="utf-8") == "Hello"
+
+        tampered = packed.replace("Hello", "Jello")
+        assert unpack_content(tampered, temp_dir / "tampered", config) == []